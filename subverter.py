@@ -56,10 +56,30 @@ subverter.py
 """
 
 import argparse
+import sys
 from pathlib import Path
 
-from subverter_lib.installers import install, uninstall
-from subverter_lib.pipeline import run_pipeline
+# Pre-rendered `--help` output for the bare `SubVerter` invocation, so that case
+# skips building the parser and importing the pipeline.
+# Keep in sync with the parser definition in main().
+_STATIC_HELP = """\
+usage: SubVerter [-h] [--install | --uninstall] [-v] [files ...]
+
+SubVerter — Context-aware subtitle translation using AI
+
+positional arguments:
+  files          One or more .srt or .mkv files to process
+
+options:
+  -h, --help     show this help message and exit
+  --install      Install dependencies, create/validate config, and add
+                 right‑click menu entries
+  --uninstall    Uninstall right-click context menu entry
+  -v, --verbose  Increase output verbosity (can be used multiple times: -v,
+                 -vv, -vvv)
+
+Example: SubVerter movie.srt -vv
+"""
 
 
 def main() -> None:
@@ -76,6 +96,12 @@ def main() -> None:
     Returns:
         None (exits with status code 0 on success, non-zero on failure)
     """
+    # Fast path: no arguments at all → static help, no parser or heavy imports
+    if len(sys.argv) == 1:
+        sys.stdout.write(_STATIC_HELP)
+        print("\n❌ No input files provided. Please specify one or more .srt or .mkv files.")
+        raise SystemExit(1)
+
     parser = argparse.ArgumentParser(
         prog="SubVerter",
         description="SubVerter — Context-aware subtitle translation using AI",
@@ -113,10 +139,13 @@ def main() -> None:
     args.verbose = min(args.verbose, 3)
 
     try:
+        # Import lazily so each branch only pays for the modules it needs
         if args.install:
+            from subverter_lib.installers import install
             install()
             return
         if args.uninstall:
+            from subverter_lib.installers import uninstall
             uninstall()
             return
         if not args.files:
@@ -124,6 +153,7 @@ def main() -> None:
             print("\n❌ No input files provided. Please specify one or more .srt or .mkv files.")
             raise SystemExit(1)
 
+        from subverter_lib.pipeline import run_pipeline
         run_pipeline(args.files, verbosity=args.verbose)
         print("\n✅ Done. You can close this window.")
 
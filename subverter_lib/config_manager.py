@@ -11,15 +11,33 @@ Handles:
 - Ensuring all required keys exist.
 """
 
+import copy
 import json
+import os
+import stat
+import tempfile
 from pathlib import Path
 from typing import Any
 
-from subverter_lib.lang_utils import normalize_lang_code
+from subverter_lib.lang_utils import VALID_LANG_CODES, normalize_lang_code
+
+# orjson (in requirements.txt) parses UTF-8 bytes directly in C; fall back to stdlib
+# json if it isn't installed. Shared with mkv_utils for mkvmerge -J output.
+# Writing stays on json.dumps() so config.json's formatting never depends on it.
+# orjson.JSONDecodeError subclasses json.JSONDecodeError, so error handling is shared.
+try:
+    import orjson
+    _json_loads = orjson.loads
+except ImportError:
+    _json_loads = json.loads
 
 # Path to the configuration file (stored in cfg/ at project root)
 CONFIG_PATH = Path(__file__).parent.parent / "cfg" / "config.json"
 
+# In-memory cache of the last loaded config, keyed by the file's mtime_ns.
+# Invalidated by save_config() so callers always see their own writes.
+_CFG_CACHE: tuple[int, dict[str, Any]] | None = None
+
 # DEFAULT_CONFIG defines all required keys with safe defaults
 DEFAULT_CONFIG: dict[str, Any] = {
     # Keep one browser window open and start a new chat per block (faster).
@@ -37,6 +55,10 @@ DEFAULT_CONFIG: dict[str, Any] = {
     "target_language": "nl",
     "allowed_src_langs_ordered": ["en", "fr", "de", "es", "it"],
 
+    # Trust an MKV track's language_ietf tag and skip langdetect on the extracted SRT.
+    # Detection still runs for legacy-only tags and very small tracks.
+    "trust_mkv_language_tag": True,
+
     "backend": "copilot_web",
     "model": "ignored_for_copilot_web",
 
@@ -58,21 +80,46 @@ DEFAULT_CONFIG: dict[str, Any] = {
 }
 
 
-def stringify_paths(obj: Any) -> Any:
-    if isinstance(obj, dict):
-        return {k: stringify_paths(v) for k, v in obj.items()}
-    if isinstance(obj, list):
-        return [stringify_paths(v) for v in obj]
+def _json_default(obj: Any) -> Any:
+    """
+    json.dumps() fallback: serialise Path objects as plain strings on demand.
+    """
     if isinstance(obj, Path):
         return str(obj)
-    return obj
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+def _write_config_bytes(data: bytes) -> None:
+    """
+    Atomically replace CONFIG_PATH with data (temp file in the same dir + os.replace).
+    The file keeps its existing permissions (mkstemp creates the temp file as 0600);
+    a new file gets the usual 0666 & ~umask.
+
+    Raises:
+        OSError: If the temp file cannot be written or moved into place.
+    """
+    fd, tmp_name = tempfile.mkstemp(dir=CONFIG_PATH.parent, prefix=CONFIG_PATH.name, suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(data)
+        try:
+            mode = stat.S_IMODE(CONFIG_PATH.stat().st_mode)
+        except FileNotFoundError:
+            umask = os.umask(0)  # umask can only be read by setting it
+            os.umask(umask)
+            mode = 0o666 & ~umask
+        os.chmod(tmp_name, mode)
+        os.replace(tmp_name, CONFIG_PATH)
+    except BaseException:
+        Path(tmp_name).unlink(missing_ok=True)
+        raise
 
 
 def create_default_config() -> None:
     """
     Create config.json with default values if it doesn't exist.
 
-    - Converts all Path objects to strings for JSON serialization.
+    - Serialises Path objects as strings via the JSON default handler.
     - Writes the config to disk at CONFIG_PATH.
     - Prints a warning if the file already exists.
     - Handles file system errors gracefully.
@@ -84,16 +131,17 @@ def create_default_config() -> None:
         print(f"   ⚠️ Config already exists at {CONFIG_PATH}")
         return
 
-    clean_config = stringify_paths(DEFAULT_CONFIG)
     try:
-        CONFIG_PATH.write_text(json.dumps(clean_config, indent=2), encoding="utf-8")
+        _write_config_bytes(
+            json.dumps(DEFAULT_CONFIG, indent=2, default=_json_default).encode("utf-8")
+        )
     except OSError as e:
         print(f"   ❌ Failed to write config file: {e}")
         return
 
     print(f"   ✅ Created default config at: {CONFIG_PATH}")
     print("   📄 Default values:")
-    for key, value in clean_config.items():
+    for key, value in DEFAULT_CONFIG.items():
         print(f"      {key}: {value}")
 
 
@@ -101,7 +149,7 @@ def ensure_keys(cfg: dict[str, Any]) -> dict[str, Any]:
     """
     Ensure all expected keys from DEFAULT_CONFIG are present in cfg.
     Missing keys are added with default values. If updated, the config is saved
-    with all Path objects converted to strings for JSON serialization.
+    (Path objects are serialised as strings by save_config).
 
     Returns:
         dict[str, Any]: Updated configuration dictionary.
@@ -112,7 +160,7 @@ def ensure_keys(cfg: dict[str, Any]) -> dict[str, Any]:
             cfg[key] = value
             updated = True
     if updated:
-        save_config(stringify_paths(cfg), updated=True)
+        save_config(cfg, updated=True)
     return cfg
 
 
@@ -134,6 +182,9 @@ def load_config() -> dict[str, Any]:
     Load config.json, creating it if missing.
     Ensures all keys exist and normalizes paths.
 
+    The parsed result is cached in memory while config.json's mtime is
+    unchanged; each call returns a fresh copy so callers may mutate it.
+
     Returns:
         dict[str, Any]: Parsed and normalized configuration dictionary.
 
@@ -141,11 +192,16 @@ def load_config() -> dict[str, Any]:
         json.JSONDecodeError: If config.json exists but is invalid.
         OSError: If reading the file fails.
     """
+    global _CFG_CACHE
+
     if not CONFIG_PATH.exists():
         create_default_config()
 
     try:
-        cfg = json.loads(CONFIG_PATH.read_text(encoding="utf-8"))
+        mtime_ns = CONFIG_PATH.stat().st_mtime_ns
+        if _CFG_CACHE is not None and _CFG_CACHE[0] == mtime_ns:
+            return copy.deepcopy(_CFG_CACHE[1])
+        cfg = _json_loads(CONFIG_PATH.read_bytes())
     except json.JSONDecodeError as e:
         print(f"   ❌ Config file is corrupted: {e}")
         print(f"   ⚠️ Please fix or delete {CONFIG_PATH} and try again.")
@@ -154,9 +210,14 @@ def load_config() -> dict[str, Any]:
         print(f"   ❌ Failed to read config file: {e}")
         raise
 
-
     cfg = ensure_keys(cfg)
     cfg = normalize_paths(cfg)
+
+    # Re-stat: ensure_keys() may have rewritten the file
+    try:
+        _CFG_CACHE = (CONFIG_PATH.stat().st_mtime_ns, copy.deepcopy(cfg))
+    except OSError:
+        _CFG_CACHE = None
     return cfg
 
 
@@ -164,6 +225,8 @@ def save_config(cfg: dict[str, Any], updated: bool = True) -> None:
     """
     Save updated config to disk.
     Converts Path objects back to strings for JSON serialization.
+    The write is skipped when the serialised bytes match what is already on disk;
+    otherwise the file is replaced atomically.
 
     Args:
         cfg (dict[str, Any]): Configuration dictionary to save.
@@ -172,15 +235,19 @@ def save_config(cfg: dict[str, Any], updated: bool = True) -> None:
     Returns:
         None
     """
-    serialisable_cfg = {
-        k: str(v) if isinstance(v, Path) else v for k, v in cfg.items()
-    }
+    global _CFG_CACHE
 
+    data = json.dumps(cfg, indent=2, default=_json_default).encode("utf-8")
     try:
-        CONFIG_PATH.write_text(json.dumps(serialisable_cfg, indent=2), encoding="utf-8")
+        if CONFIG_PATH.exists() and CONFIG_PATH.read_bytes() == data:
+            print(f"\n💾 Config already up to date at {CONFIG_PATH}")
+            return
+        _write_config_bytes(data)
     except OSError as e:
         print(f"\n❌ Failed to save config file: {e}")
         return
+    finally:
+        _CFG_CACHE = None
 
     if updated:
         print(f"\n💾 Updated config at {CONFIG_PATH}")
@@ -192,13 +259,7 @@ def is_valid_language_code(code: str) -> bool:
     """
     Check if a language code is valid (ISO 639-1 or ISO 639-2).
     """
-    valid_langs = {
-        "en", "fr", "de", "es", "it", "nl", "pt", "ru", "ja", "zh", "ar", "tr", "pl",
-        "sv", "no", "fi", "da", "cs", "el", "ko",
-        "eng", "fra", "deu", "spa", "ita", "nld", "por", "rus", "jpn", "zho", "ara",
-        "tur", "pol", "swe", "nor", "fin", "dan", "ces", "ell", "kor",
-    }
-    return code.lower() in valid_langs
+    return code.lower() in VALID_LANG_CODES
 
 
 def validate_config(cfg: dict[str, Any], interactive: bool = True) -> bool:
@@ -209,7 +270,7 @@ def validate_config(cfg: dict[str, Any], interactive: bool = True) -> bool:
     1. Tool paths (ollama, mkvextract, mkvmerge) must exist.
     2. Target language must be valid after normalization.
     3. Allowed source languages must be valid after normalization.
-    4. keep_browser_alive must be a boolean.
+    4. keep_browser_alive and trust_mkv_language_tag must be booleans.
     5. summary_max_chars must be a positive integer.
 
     Args:
@@ -240,7 +301,7 @@ def validate_config(cfg: dict[str, Any], interactive: bool = True) -> bool:
                 ).strip()
                 if new_path:
                     cfg[tool_key] = Path(new_path)
-                    if Path(new_path).exists():
+                    if cfg[tool_key].exists():
                         print(f"         ✅ Updated {tool_key} to {new_path}")
                         updated = True
                     else:
@@ -265,15 +326,20 @@ def validate_config(cfg: dict[str, Any], interactive: bool = True) -> bool:
     # Allowed source languages (ordered)
     raw_allowed = cfg.get("allowed_src_langs_ordered", []) or []
     normalized_allowed: list[str] = []
+    allowed_changed = False
     for lang in raw_allowed:
+        # normalize_lang_code() output is already lower-case, so one set probe suffices
         norm_lang = normalize_lang_code(lang)
-        if not norm_lang or not is_valid_language_code(norm_lang):
+        if not norm_lang or norm_lang not in VALID_LANG_CODES:
             print(f"         ⚠️ Invalid allowed_src_langs_ordered entry: {lang}")
             ok = False
+            allowed_changed = True
             continue
         normalized_allowed.append(norm_lang)
+        if norm_lang != lang:
+            allowed_changed = True
 
-    if normalized_allowed != raw_allowed:
+    if allowed_changed:
         print(
             f"         ℹ️ Normalized allowed_src_langs_ordered: "
             f"{raw_allowed} -> {normalized_allowed}"
@@ -290,6 +356,13 @@ def validate_config(cfg: dict[str, Any], interactive: bool = True) -> bool:
     else:
         print(f"         ✅ keep_browser_alive: {keep_alive}")
 
+    trust_tag = cfg.get("trust_mkv_language_tag", True)
+    if not isinstance(trust_tag, bool):
+        print(f"         ⚠️ Invalid trust_mkv_language_tag: {trust_tag} (must be boolean)")
+        ok = False
+    else:
+        print(f"         ✅ trust_mkv_language_tag: {trust_tag}")
+
     # --- Summary max chars check ---
     summary_chars = cfg.get("summary_max_chars", 500)
     if not isinstance(summary_chars, int) or summary_chars < 0:
@@ -8,36 +8,157 @@ Uses Playwright to log in to https://copilot.microsoft.com and send prompts.
 Stores session cookies in cfg/copilot_storage.json for reuse.
 """
 
+import atexit
 import sys
 import time
 import random
+from functools import lru_cache
 from pathlib import Path
-from typing import Optional
+from typing import TYPE_CHECKING, Optional
 
-from playwright.sync_api import TimeoutError, sync_playwright, Page  # ✅ sync API
+# Playwright (sync API) is imported inside the methods that drive the browser:
+# it is slow to import, and this module is also imported just for STORAGE_FILE.
+if TYPE_CHECKING:
+    from playwright.sync_api import Page
 
 COPILOT_URL = "https://copilot.microsoft.com"
 STORAGE_FILE = Path(__file__).parent.parent / "cfg" / "copilot_storage.json"
 
+# A saved session younger than this is reused by login_and_save_session() unless forced
+SESSION_MAX_AGE_DAYS = 14
+
 # Selector for the Copilot prompt text box.
 # If Microsoft changes the DOM, update this in ONE place.
 PROMPT_SELECTOR = "textarea#userInput"
 
+# Reply-settled check, evaluated inside the browser: on first call it attaches a
+# MutationObserver that timestamps every change to the reply subtree; it returns
+# true once the reply has been idle for idleMs. Only a boolean crosses the CDP
+# channel per check, and the reply is never serialised.
+REPLY_IDLE_MS = 2000  # streaming is treated as finished after 2 s without changes
+REPLY_CHECK_MS = 100
+REPLY_SETTLED_JS = """([el, idleMs]) => {
+    if (!el.__subverterObserver) {
+        el.__subverterChanged = performance.now();
+        el.__subverterObserver = new MutationObserver(() => {
+            el.__subverterChanged = performance.now();
+        });
+        el.__subverterObserver.observe(el, {subtree: true, childList: true, characterData: true});
+    }
+    if (performance.now() - el.__subverterChanged < idleMs) return false;
+    el.__subverterObserver.disconnect();
+    return true;
+}"""
+
+# Collects the trimmed, non-empty text of every reply span in one evaluate() call
+# (instead of two inner_text() round-trips per span)
+REPLY_SPAN_SELECTOR = "span.font-ligatures-none.whitespace-pre-wrap"
+REPLY_TEXTS_JS = """(el, selector) => {
+    const out = [];
+    for (const span of el.querySelectorAll(selector)) {
+        const text = span.innerText.trim();
+        if (text) out.push(text);
+    }
+    return out;
+}"""
+
+# Process-wide Playwright driver (a Node subprocess), started on first use and
+# shared by every browser launch; stopped when the interpreter exits
+_playwright = None
+
+
+def _get_playwright():
+    """
+    Return the shared Playwright driver, starting it on first call.
+    """
+    global _playwright
+    if _playwright is None:
+        from playwright.sync_api import sync_playwright
+        _playwright = sync_playwright().start()
+        atexit.register(_stop_playwright)
+    return _playwright
+
+
+def _stop_playwright() -> None:
+    global _playwright
+    if _playwright is not None:
+        try:
+            _playwright.stop()
+        except Exception as e:
+            print(f"⚠️ Failed to stop Playwright: {e}")
+        _playwright = None
+
 
 class CopilotClient:
-    def __init__(self, headless: bool = True) -> None:
+    def __init__(
+        self,
+        headless: bool = True,
+        humanize: Optional[bool] = None,
+        require_session: bool = False
+    ) -> None:
         self.headless = headless
+        # Human-like pacing only matters in a visible window; headless runs skip it
+        self.humanize = (not headless) if humanize is None else humanize
         self.storage_file = STORAGE_FILE
+        self._session_found = False  # storage_file checked once, then trusted
+        if require_session:
+            self._require_session()  # fail fast, before any browser work
         # For persistent browser mode
-        self._p = None
         self._browser = None
         self._context = None
         self._page: Optional[Page] = None
+        self._topic_used = False  # a prompt was sent in the current chat thread
+
+    def __enter__(self) -> CopilotClient:
+        """
+        Launch the persistent browser once for a whole job:
+
+            with CopilotClient() as client:
+                for prompt in prompts:
+                    client.run_prompt(prompt)
+        """
+        self.launch()
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def _require_session(self) -> None:
+        """
+        Raise FileNotFoundError if no saved session exists.
+        A successful check is remembered, so repeated prompts don't re-stat the file.
+        """
+        if self._session_found:
+            return
+        if not self.storage_file.exists():
+            raise FileNotFoundError(
+                f"No saved session found at {self.storage_file}. "
+                f"Run login_and_save_session() first."
+            )
+        self._session_found = True
+
+    def _session_valid(self, max_age_days: float = SESSION_MAX_AGE_DAYS) -> bool:
+        """
+        Return True if a saved session exists and was written within max_age_days.
+        """
+        try:
+            age_sec = time.time() - self.storage_file.stat().st_mtime
+        except OSError:
+            return False
+        return age_sec < max_age_days * 86400
 
-    def login_and_save_session(self) -> None:
+    def login_and_save_session(self, force: bool = False) -> None:
         """
         Launch browser for manual login and save session cookies.
+
+        Args:
+            force: Log in again even if a recent saved session exists.
         """
+        if not force and self._session_valid():
+            print(f"\n✅ Recent Copilot session found at {self.storage_file} — skipping login.")
+            print("   ↳ Use --force to log in again anyway.")
+            return
+
         print("\n🔐 Launching Copilot login browser...")
         print("   ➡️ Please log in with your Microsoft account.")
         print("   ✅ Choose 'Stay signed in' when prompted.")
@@ -46,13 +167,14 @@ class CopilotClient:
         input("   ⏳ Press Enter here once you're logged in...")
 
         try:
-            with sync_playwright() as p:
-                browser = p.chromium.launch(headless=False)
+            browser = _get_playwright().chromium.launch(headless=False)
+            try:
                 context = browser.new_context()
                 page = context.new_page()
                 page.goto(COPILOT_URL)
                 input("   ✅ Press Enter again to save session and close browser...")
                 context.storage_state(path=str(self.storage_file))
+            finally:
                 browser.close()
         except Exception as e:
             print(f"\n❌ Failed to complete login flow: {e}")
@@ -69,17 +191,12 @@ class CopilotClient:
         Launch browser and open Copilot once (persistent browser mode).
         Also switches to Smart (GPT‑5) mode once per session.
         """
-        if not self.storage_file.exists():
-            raise FileNotFoundError(
-                f"No saved session found at {self.storage_file}. "
-                f"Run login_and_save_session() first."
-            )
+        self._require_session()
         if self._browser:
             return  # already launched
 
         try:
-            self._p = sync_playwright().start()
-            self._browser = self._p.chromium.launch(headless=self.headless)
+            self._browser = _get_playwright().chromium.launch(headless=self.headless)
             self._context = self._browser.new_context(storage_state=str(self.storage_file))
             self._page = self._context.new_page()
             if verbosity >= 3:
@@ -101,9 +218,11 @@ class CopilotClient:
             self._page,
             "",  # no intro text
             "",  # no subtitles text
-            "Tab,Tab,Enter,ArrowDown,ArrowDown,Enter,Shift+Tab,Shift+Tab"
+            "Tab,Tab,Enter,ArrowDown,ArrowDown,Enter,Shift+Tab,Shift+Tab",
+            humanize=self.humanize
         )
         human_delay(0.5, 1.2)
+        self._topic_used = False
 
     def start_new_topic(self, verbosity: int = 0) -> None:
         """
@@ -124,11 +243,13 @@ class CopilotClient:
             self._page,
             "",  # no intro text
             "",  # no subtitles text
-            "Tab,Tab,Tab,Enter,Enter"  # example: navigate to toolbar, press Enter twice
+            "Tab,Tab,Tab,Enter,Enter",  # example: navigate to toolbar, press Enter twice
+            humanize=self.humanize
         )
 
         human_delay(0.5, 1.2)
         self._page.wait_for_selector(PROMPT_SELECTOR, timeout=10000)
+        self._topic_used = False
 
     def send_prompt(self, prompt_text: str, timeout_sec: int = 30, verbosity: int = 0) -> Optional[str]:
         """
@@ -141,85 +262,94 @@ class CopilotClient:
             print(f"⌨️ Entering prompt: {prompt_text!r}")
         self._page.fill(PROMPT_SELECTOR, prompt_text)
         self._page.keyboard.press("Enter")
+        self._topic_used = True
+
+        return self._await_reply(self._page, timeout_sec, verbosity)
+
+    def _await_reply(self, page: Page, timeout_sec: int, verbosity: int = 0) -> Optional[str]:
+        """
+        Wait for the assistant's latest reply on page to finish and return its text.
+        Shared by persistent (send_prompt) and one-shot (run_prompt) modes.
+        """
+        from playwright.sync_api import TimeoutError
 
         if verbosity >= 3:
             print("⏳ Waiting for assistant's reply container…")
+        # Lazy locator for the newest reply: one selector run when waiting,
+        # one when resolving the handle (no separate query_selector_all pass)
+        reply = page.locator('div[data-content="ai-message"]').last
         try:
-            self._page.wait_for_selector('div[data-content="ai-message"]', timeout=timeout_sec * 1000)
+            reply.wait_for(timeout=timeout_sec * 1000)
+            last_msg = reply.element_handle(timeout=timeout_sec * 1000)
         except TimeoutError:
             print("⚠️ Timed out waiting for assistant reply.")
             return None
 
-        messages = self._page.query_selector_all('div[data-content="ai-message"]')
-        if not messages:
-            print("⚠️ No assistant reply received or found.")
-            return None
-        last_msg = messages[-1]
-
         if verbosity >= 3:
             print("⏳ Waiting for reply content to stabilise…")
 
-        stable_count = 0
-        last_html = ""
-        start_time = time.time()
-        while time.time() - start_time < timeout_sec:
-            current_html = last_msg.inner_html()
-            if current_html == last_html:
-                stable_count += 1
-            else:
-                stable_count = 0
-                last_html = current_html
-            if stable_count >= 2:
-                break
-            time.sleep(1)
-
-        spans = last_msg.query_selector_all("span.font-ligatures-none.whitespace-pre-wrap")
-        texts = [span.inner_text().strip() for span in spans if span.inner_text().strip()]
+        try:
+            page.wait_for_function(
+                REPLY_SETTLED_JS,
+                arg=[last_msg, REPLY_IDLE_MS],
+                polling=REPLY_CHECK_MS,
+                timeout=timeout_sec * 1000
+            )
+        except TimeoutError:
+            pass  # still streaming at the deadline — take what is there
+
+        texts = last_msg.evaluate(REPLY_TEXTS_JS, REPLY_SPAN_SELECTOR)
         if verbosity >= 3:
             print(f"📄 Found {len(texts)} spans in assistant's reply.")
         return "\n".join(texts).strip() if texts else None
 
     def close(self) -> None:
         """
-        Close browser and Playwright (persistent browser mode).
+        Close the browser (persistent browser mode).
+        The shared Playwright driver keeps running for later launches.
         """
         try:
             if self._browser:
                 self._browser.close()
         except Exception as e:
             print(f"⚠️ Failed to close browser: {e}")
-        try:
-            if self._p:
-                self._p.stop()
-        except Exception as e:
-            print(f"⚠️ Failed to stop Playwright: {e}")
         self._browser = None
         self._context = None
         self._page = None
-        self._p = None
 
-    # ------------------------------
-    # One-shot mode (current behaviour)
-    # ------------------------------
     def run_prompt(self, prompt_text: str, timeout_sec: int = 30, verbosity: int = 0) -> Optional[str]:
         """
         Send a prompt to Copilot and return the full text response from the assistant only.
+
+        If launch() has been called, the open browser is reused (in a fresh chat topic);
+        otherwise a browser is launched and closed just for this prompt.
+        """
+        if self._browser:
+            if self._topic_used:
+                self.start_new_topic(verbosity=verbosity)
+            return self.send_prompt(prompt_text, timeout_sec=timeout_sec, verbosity=verbosity)
+        return self._run_prompt_oneshot(prompt_text, timeout_sec=timeout_sec, verbosity=verbosity)
+
+    # ------------------------------
+    # One-shot mode
+    # ------------------------------
+    def _run_prompt_oneshot(self, prompt_text: str, timeout_sec: int = 30, verbosity: int = 0) -> Optional[str]:
+        """
+        Launch a browser, send one prompt and close it again.
         Uses the <div data-content="ai-message"> container to detect when the reply is complete.
         """
-        if not self.storage_file.exists():
-            raise FileNotFoundError(
-                f"No saved session found at {self.storage_file}. "
-                f"Run login_and_save_session() first."
-            )
+        self._require_session()
 
         headless_mode = self.headless
         if verbosity >= 2:
             headless_mode = False
             print("🪟 Verbose mode: launching visible browser window for debugging…")
 
+        from playwright.sync_api import TimeoutError
+
         try:
-            with sync_playwright() as p:
-                browser = p.chromium.launch(headless=headless_mode)
+            browser = _get_playwright().chromium.launch(headless=headless_mode)
+            try:
                 context = browser.new_context(storage_state=str(self.storage_file))
                 page = context.new_page()
 
@@ -241,7 +371,8 @@ class CopilotClient:
                     page,
                     "",  # no intro text
                     "",  # no subtitles text
-                    "Tab,Tab,Enter,ArrowDown,ArrowDown,Enter,Shift+Tab,Shift+Tab"
+                    "Tab,Tab,Enter,ArrowDown,ArrowDown,Enter,Shift+Tab,Shift+Tab",
+                    humanize=self.humanize
                 )
                 human_delay(0.5, 1.2)
 
@@ -252,44 +383,13 @@ class CopilotClient:
                     page,
                     "",              # intro_text
                     prompt_text,     # subtitles_text
-                    "Tab,Tab,Tab,Tab,Enter"  # navigate to submit button and press Enter
+                    "Tab,Tab,Tab,Tab,Enter",  # navigate to submit button and press Enter
+                    humanize=self.humanize
                 )
 
-                if verbosity >= 3:
-                    print("⏳ Waiting for assistant's reply container…")
-                page.wait_for_selector('div[data-content="ai-message"]', timeout=timeout_sec * 1000)
-
-                messages = page.query_selector_all('div[data-content="ai-message"]')
-                if not messages:
-                    print("⚠️ No assistant reply received or found.")
-                    return None
-                last_msg = messages[-1]
-
-                if verbosity >= 3:
-                    print("⏳ Waiting for reply content to stabilise…")
-
-                stable_count = 0
-                last_html = ""
-                start_time = time.time()
-                while time.time() - start_time < timeout_sec:
-                    current_html = last_msg.inner_html()
-                    if current_html == last_html:
-                        stable_count += 1
-                    else:
-                        stable_count = 0
-                        last_html = current_html
-                    if stable_count >= 2:
-                        break
-                    time.sleep(1)
-
-                spans = last_msg.query_selector_all("span.font-ligatures-none.whitespace-pre-wrap")
-                texts = [span.inner_text().strip() for span in spans if span.inner_text().strip()]
-                if verbosity >= 3:
-                    print(f"📄 Found {len(texts)} spans in assistant's reply.")
-
-                response_text = "\n".join(texts)
+                return self._await_reply(page, timeout_sec, verbosity)
+            finally:
                 browser.close()
-                return response_text.strip() if response_text else None
         except TimeoutError:
             print("⚠️ Timed out waiting for assistant reply.")
             return None
@@ -317,18 +417,26 @@ def human_delay(short_range=(0.3, 3.0), long_range=(3.0, 8.0), long_chance=0.1):
     elif not isinstance(long_range, (tuple, list)):
         long_range = (float(long_range), float(long_range))
 
-    if random.random() < long_chance:
-        delay = random.uniform(*long_range)
+    # One draw picks the range and, rescaled to [0, 1), the position within it
+    r = random.random()
+    if r < long_chance:
+        low, high = long_range
+        pos = r / long_chance
     else:
-        delay = random.uniform(*short_range)
+        low, high = short_range
+        pos = (r - long_chance) / (1.0 - long_chance)
 
-    time.sleep(delay)
+    time.sleep(low + (high - low) * pos)
 
 
 # ======================
 # HUMAN-LIKE MOUSE CLICK
 # ======================
-def human_click(page: Page, selector: str, move_steps=25):
+# Number of jittered waypoints per mouse glide in human_click()
+GLIDE_SEGMENTS = 4
+
+
+def human_click(page: Page, selector: str, move_steps=25, humanize: bool = True):
     """
     Simulate a human-like mouse click:
     1. Start from a random point on a random edge of the viewport.
@@ -338,7 +446,21 @@ def human_click(page: Page, selector: str, move_steps=25):
 
     - selector: CSS selector for the element to click
     - move_steps: number of interpolation steps for the glide
+    - humanize: if False, just click the element (no glides), e.g. for headless runs
+
+    Each glide is sent as GLIDE_SEGMENTS jittered waypoints; Playwright's driver
+    interpolates the steps between them (mouse.move(..., steps=n)), so a glide
+    costs a few round-trips instead of one per step.
     """
+    if not humanize:
+        try:
+            page.click(selector)
+        except Exception as e:
+            print(f"❌ Failed to click element {selector}: {e}")
+            return
+        human_delay((0.05, 0.15), long_chance=0)
+        return
+
     try:
         element = page.query_selector(selector)
         if not element:
@@ -367,33 +489,50 @@ def human_click(page: Page, selector: str, move_steps=25):
         else:
             return viewport["width"], random.uniform(0, viewport["height"])
 
+    segment_steps = max(1, move_steps // GLIDE_SEGMENTS)
+
+    def glide(from_x, from_y, to_x, to_y):
+        for i in range(1, GLIDE_SEGMENTS + 1):
+            frac = i / GLIDE_SEGMENTS
+            jitter = 2 if i < GLIDE_SEGMENTS else 0  # land exactly on the end point
+            page.mouse.move(
+                from_x + (to_x - from_x) * frac + random.uniform(-jitter, jitter),
+                from_y + (to_y - from_y) * frac + random.uniform(-jitter, jitter),
+                steps=segment_steps
+            )
+        human_delay((0.1, 0.3), long_chance=0)
+
     # Start from random edge
     start_x, start_y = random_edge_point()
     page.mouse.move(start_x, start_y)
 
     # Glide to target with jitter
-    for i in range(move_steps):
-        nx = start_x + (target_x - start_x) * (i + 1) / move_steps + random.uniform(-2, 2)
-        ny = start_y + (target_y - start_y) * (i + 1) / move_steps + random.uniform(-2, 2)
-        page.mouse.move(nx, ny)
-        time.sleep(random.uniform(0.01, 0.03))
+    glide(start_x, start_y, target_x, target_y)
 
     # Click
     page.mouse.click(target_x, target_y)
 
     # Glide away to random edge
     leave_x, leave_y = random_edge_point()
-    for i in range(move_steps):
-        nx = target_x + (leave_x - target_x) * (i + 1) / move_steps + random.uniform(-2, 2)
-        ny = target_y + (leave_y - target_y) * (i + 1) / move_steps + random.uniform(-2, 2)
-        page.mouse.move(nx, ny)
-        time.sleep(random.uniform(0.01, 0.03))
+    glide(target_x, target_y, leave_x, leave_y)
 
 
 # =====================
 # FLEXIBLE HUMAN SUBMIT
 # =====================
-def human_submit(page: Page, intro_text: str, subtitles_text: str, sequence: str):
+# Pause after each key press in human_submit(humanize=False)
+KEY_SETTLE_SEC = 0.05
+
+
+@lru_cache(maxsize=32)
+def _parse_key_sequence(sequence: str) -> tuple[str, ...]:
+    """
+    Split a comma-separated key sequence into key names (parsed once per distinct sequence).
+    """
+    return tuple(key for key in (action.strip() for action in sequence.split(",")) if key)
+
+
+def human_submit(page: Page, intro_text: str, subtitles_text: str, sequence: str, humanize: bool = True):
     """
     Paste intro + subtitles into the prompt box, then execute a sequence of key presses.
 
@@ -403,35 +542,41 @@ def human_submit(page: Page, intro_text: str, subtitles_text: str, sequence: str
     - sequence: comma-separated string of Playwright key names
                 Example: "Tab,Tab,Enter,ArrowDown,Enter"
                 Valid key names: https://playwright.dev/docs/api/class-keyboard#keyboard-press
+    - humanize: if False, replace the random pauses with a short fixed settle
+                time per key (menus still need a moment to open)
     """
     try:
-        # Ensure prompt box is focused (check by selector)
-        is_focused = page.evaluate(f"""
-            document.activeElement === document.querySelector("{PROMPT_SELECTOR}")
-        """)
-        if not is_focused:
-            page.focus(PROMPT_SELECTOR)
+        # Resolve the prompt box once; focus() is a no-op if it already has focus
+        prompt_box = page.query_selector(PROMPT_SELECTOR)
+        if not prompt_box:
+            raise ValueError(f"Element {PROMPT_SELECTOR} not found on page.")
+        prompt_box.focus()
     except Exception as e:
         print(f"❌ Failed to focus prompt box: {e}")
         return
 
     try:
         # Paste intro + subtitles
-        page.fill(PROMPT_SELECTOR, intro_text + "\n" + subtitles_text)
+        prompt_box.fill("\n".join((intro_text, subtitles_text)))  # one copy of a large block
     except Exception as e:
         print(f"❌ Failed to fill prompt box: {e}")
         return
 
-    human_delay(0.8, 2.0)
+    if humanize:
+        human_delay(0.8, 2.0)
 
     # Execute sequence exactly as given
-    for action in sequence.split(","):
-        key = action.strip()
-        if key:
+    for key in _parse_key_sequence(sequence):
+        if humanize:
+            # Key hold time is paced by the driver; the gap between keys stays short
+            # (no occasional multi-second "long" pause in the middle of a sequence)
+            page.keyboard.press(key, delay=random.randint(50, 200))
+            human_delay((0.2, 0.6), long_chance=0)
+        else:
             page.keyboard.press(key)
-            human_delay(0.2, 0.6)
+            time.sleep(KEY_SETTLE_SEC)
             
 # Optional CLI entry point
 if __name__ == "__main__":
     client = CopilotClient(headless=False)
-    client.login_and_save_session()
\ No newline at end of file
+    client.login_and_save_session(force="--force" in sys.argv[1:])
\ No newline at end of file
@@ -1,7 +1,11 @@
 #!/usr/bin/env python3
 from __future__ import annotations
 
+import hashlib
+import importlib.metadata
+import importlib.util
 import os
+import re
 import site
 import subprocess
 import sys
@@ -10,6 +14,70 @@ from pathlib import Path
 
 from subverter_lib.config_manager import create_default_config, load_config, validate_config
 
+# Right-click context menu verbs registered under HKCU: (file extension, menu label)
+CONTEXT_MENU_VERBS: list[tuple[str, str]] = [
+    (".srt", "Translate with SubVerter"),
+    (".mkv", "Translate with SubVerter"),
+]
+
+# REQUIREMENTS_STAMP — SHA-256 of the interpreter + requirements.txt last installed successfully;
+# lets a repeat --install skip pip when nothing changed and every requirement still imports
+REQUIREMENTS_STAMP = Path(__file__).parent.parent / "cfg" / "requirements.sha256"
+
+
+def _requirements_importable(req_file: Path) -> bool:
+    """
+    Return True if every package listed in req_file is installed and its
+    top-level module can still be found (guards the stamp against removed or
+    broken packages).
+    """
+    for line in req_file.read_text(encoding="utf-8").splitlines():
+        name = re.split(r"[\s<>=!~;\[#]", line.strip(), maxsplit=1)[0]
+        if not name:
+            continue
+        try:
+            dist = importlib.metadata.distribution(name)
+        except importlib.metadata.PackageNotFoundError:
+            return False
+        top_level = (dist.read_text("top_level.txt") or "").split() or [name.replace("-", "_")]
+        if any(importlib.util.find_spec(mod) is None for mod in top_level):
+            return False
+    return True
+
+
+def _verb_key_path(ext: str) -> str:
+    return f"Software\\Classes\\SystemFileAssociations\\{ext}\\shell\\SubVerter"
+
+
+def _register_verb(ext: str, label: str, command: str) -> None:
+    """
+    Create the context menu verb key for one extension and its 'command' subkey.
+
+    The subkey is created relative to the already-open verb key handle, so each
+    extension costs one open from HKCU instead of two.
+    """
+    key_path = _verb_key_path(ext)
+    cmd_key_path = key_path + "\\command"
+
+    try:
+        with winreg.CreateKeyEx(
+            winreg.HKEY_CURRENT_USER, key_path, 0,
+            winreg.KEY_SET_VALUE | winreg.KEY_CREATE_SUB_KEY
+        ) as key:
+            winreg.SetValueEx(key, None, 0, winreg.REG_SZ, label)
+            print(f"   📝 Created key: HKCU\\{key_path}")
+            print(f"      ↳ Set default value: '{label}'")
+
+            try:
+                with winreg.CreateKeyEx(key, "command", 0, winreg.KEY_SET_VALUE) as cmd_key:
+                    winreg.SetValueEx(cmd_key, None, 0, winreg.REG_SZ, command)
+                    print(f"   📝 Created key: HKCU\\{cmd_key_path}")
+                    print(f"      ↳ Set default value: {command}")
+            except OSError as e:
+                print(f"   ❌ Failed to create registry key {cmd_key_path}: {e}")
+    except OSError as e:
+        print(f"   ❌ Failed to create registry key {key_path}: {e}")
+
 
 def install() -> None:
     """
@@ -44,23 +112,39 @@ def install() -> None:
         print("      pip install --user -r requirements.txt")
 
     if req_file.exists():
+        # Keyed on the interpreter too, so switching Pythons still installs
+        req_hash = hashlib.sha256(sys.executable.encode() + b"\0" + req_file.read_bytes()).hexdigest()
         try:
+            installed_hash = REQUIREMENTS_STAMP.read_text(encoding="utf-8").strip()
+        except OSError:
+            installed_hash = None
+
+        if installed_hash == req_hash and _requirements_importable(req_file):
+            print("   ✅ Dependencies already installed (requirements.txt unchanged)")
+        else:
+            # --prefer-binary: take a wheel over a newer sdist so nothing is built locally
+            # (pip's own wheel cache already makes repeat installs fetch-free).
+            # No self-version check (an extra HTTP request) and no prompts; errors still reach stderr.
+            # Output goes straight to the console so progress is visible and nothing is buffered.
             result = subprocess.run(
-                [sys.executable, "-m", "pip", "install", "-r", str(req_file)],
-                capture_output=True,
-                text=True
+                [
+                    sys.executable, "-m", "pip", "install",
+                    "--disable-pip-version-check", "--no-input", "-q",
+                    "--prefer-binary", "-r", str(req_file),
+                ],
+                check=False
             )
             if result.returncode == 0:
                 print("   ✅ Dependencies installed from requirements.txt")
+                try:
+                    REQUIREMENTS_STAMP.parent.mkdir(parents=True, exist_ok=True)
+                    REQUIREMENTS_STAMP.write_text(req_hash, encoding="utf-8")
+                except OSError as e:
+                    print(f"   ⚠️ Could not record installed requirements: {e}")
             else:
-                print("   ❌ Failed to install dependencies.")
-                print("      stdout:", result.stdout.strip())
-                print("      stderr:", result.stderr.strip())
+                print("   ❌ Failed to install dependencies (see pip output above). Please run manually:")
+                print(f"      pip install -r {req_file}")
                 return
-        except subprocess.CalledProcessError:
-            print("   ❌ Failed to install dependencies. Please run manually:")
-            print(f"      pip install -r {req_file}")
-            return
     else:
         print("   ⚠️ requirements.txt not found. Skipping dependency installation.")
 
@@ -68,20 +152,15 @@ def install() -> None:
     # Playwright browser install
     # --------------------------
     print("\n🌐 Installing Playwright Chromium browser for Copilot automation...")
-    try:
-        result = subprocess.run(
-            [sys.executable, "-m", "playwright", "install", "chromium"],
-            capture_output=True,
-            text=True
-        )
-        if result.returncode == 0:
-            print("   ✅ Playwright Chromium installed")
-        else:
-            print("   ❌ Failed to install Playwright browser.")
-            print("      stdout:", result.stdout.strip())
-            print("      stderr:", result.stderr.strip())
-    except subprocess.CalledProcessError:
-        print("   ❌ Failed to install Playwright browser. Run manually:")
+    # Streamed to the console: the Chromium download shows its own progress bar
+    result = subprocess.run(
+        [sys.executable, "-m", "playwright", "install", "chromium"],
+        check=False
+    )
+    if result.returncode == 0:
+        print("   ✅ Playwright Chromium installed")
+    else:
+        print("   ❌ Failed to install Playwright browser (see output above). Run manually:")
         print("      playwright install chromium")
 
     # --------------
@@ -101,36 +180,22 @@ def install() -> None:
         print("   ⚠️ Registry setup aborted due to config error.")
         return
 
-    extensions = [".srt", ".mkv"]
-    for ext in extensions:
-        key_path = f"Software\\Classes\\SystemFileAssociations\\{ext}\\shell\\SubVerter"
-        cmd_key_path = key_path + r"\\command"
-
-        try:
-            with winreg.CreateKey(winreg.HKEY_CURRENT_USER, key_path) as key:
-                winreg.SetValueEx(key, None, 0, winreg.REG_SZ, "Translate with SubVerter")
-                print(f"   📝 Created key: HKCU\\{key_path}")
-                print("      ↳ Set default value: 'SubVerter'")
-        except OSError as e:
-            print(f"   ❌ Failed to create registry key {key_path}: {e}")
-
-        try:
-            with winreg.CreateKey(winreg.HKEY_CURRENT_USER, cmd_key_path) as key:
-                main_script = Path(__file__).parent.parent / "subverter.py"
-                command = f'cmd /k "cd .. && py \"{main_script}\" \"%1\""'
-                winreg.SetValueEx(key, None, 0, winreg.REG_SZ, command)
-                print(f"   📝 Created key: HKCU\\{cmd_key_path}")
-                print(f"      ↳ Set default value: {command}")
-        except OSError as e:
-            print(f"   ❌ Failed to create registry key {cmd_key_path}: {e}")
+    # Same command for every verb — build it once
+    main_script = Path(__file__).parent.parent / "subverter.py"
+    command = f'cmd /k "cd .. && py \"{main_script}\" \"%1\""'
+    for ext, label in CONTEXT_MENU_VERBS:
+        _register_verb(ext, label, command)
 
     # ------------------------------
     # Copilot Web login (if needed)
     # ------------------------------
-    if cfg.get("backend", "").lower() == "copilot_web":
+    uses_copilot = cfg.get("backend", "").lower() == "copilot_web"
+    session_saved = False
+    if uses_copilot:
         try:
             from subverter_lib.copilot_client import STORAGE_FILE, CopilotClient
-            if not STORAGE_FILE.exists():
+            session_saved = STORAGE_FILE.exists()
+            if not session_saved:
                 print("\n🌐 Copilot Web backend detected — no saved session found.")
                 print("   A browser window will now open to https://copilot.microsoft.com")
                 print("   Please follow these steps carefully:")
@@ -141,6 +206,7 @@ def install() -> None:
                 print("     5️⃣ Wait until you see the Copilot chat interface fully loaded.")
                 print("     6️⃣ Return to this terminal window and press **Enter** to continue.")
                 CopilotClient(headless=False).login_and_save_session()
+                session_saved = STORAGE_FILE.exists()
         except ImportError:
             print("❌ CopilotClient module not found. Ensure subverter_lib/copilot_client.py exists.")
 
@@ -152,8 +218,8 @@ def install() -> None:
     print("   ✔ Playwright Chromium installed")
     print("   ✔ Config created/validated")
     print("   ✔ Registry entries added for .srt and .mkv (current user only)")
-    if cfg.get("backend", "").lower() == "copilot_web":
-        if Path(__file__).parent.parent.joinpath("cfg", "copilot_storage.json").exists():
+    if uses_copilot:
+        if session_saved:
             print("   ✔ Copilot Web session saved — ready for translations")
         else:
             print("   ⚠️ Copilot Web session not saved — run `python -m subverter_lib.copilot_client` to log in")
@@ -170,11 +236,10 @@ def uninstall() -> None:
     # ------------------------------
     # Registry cleanup
     # ------------------------------
-    extensions = [".srt", ".mkv"]
     print("🗑️ Removing registry keys...\n")
-    for ext in extensions:
-        cmd_key = f"Software\\Classes\\SystemFileAssociations\\{ext}\\shell\\SubVerter\\command"
-        main_key = f"Software\\Classes\\SystemFileAssociations\\{ext}\\shell\\SubVerter"
+    for ext, _ in CONTEXT_MENU_VERBS:
+        main_key = _verb_key_path(ext)
+        cmd_key = main_key + "\\command"
 
         try:
             winreg.DeleteKey(winreg.HKEY_CURRENT_USER, cmd_key)
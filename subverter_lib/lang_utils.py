@@ -10,6 +10,9 @@ Provides:
 - Filtering of candidate language detections against an allowed list.
 """
 
+from functools import lru_cache
+from typing import Iterable
+
 # ISO639_MAP — maps common 3-letter codes to 2-letter ISO 639-1 codes
 ISO639_MAP: dict[str, str] = {
     "eng": "en", "fra": "fr", "fre": "fr", "deu": "de", "ger": "de", "spa": "es",
@@ -19,7 +22,15 @@ ISO639_MAP: dict[str, str] = {
     "gre": "el", "kor": "ko",
 }
 
+# VALID_LANG_CODES — every 2- and 3-letter code known to ISO639_MAP, so code
+# validation can never drift from what normalize_lang_code() understands
+VALID_LANG_CODES: frozenset[str] = frozenset(ISO639_MAP) | frozenset(ISO639_MAP.values())
+
+# _NORMALIZED_LANG — every known 2- or 3-letter code mapped straight to its ISO 639-1 code
+_NORMALIZED_LANG: dict[str, str] = {code: code for code in ISO639_MAP.values()} | ISO639_MAP
+
 
+@lru_cache(maxsize=256)
 def normalize_lang_code(code: str | None) -> str | None:
     """
     Normalize a language code to ISO 639-1 when possible.
@@ -38,35 +49,32 @@ def normalize_lang_code(code: str | None) -> str | None:
     if not code:
         return None
 
-    c = code.lower().strip()
-    base = c.split("-")[0]
-
-    if len(base) == 2:
-        return base
-    if len(base) == 3:
-        mapped = ISO639_MAP.get(base)
-        return mapped if mapped and len(mapped) == 2 else None
-
-    return None
+    c = code.strip().lower().partition("-")[0]
+    norm = _NORMALIZED_LANG.get(c)
+    if norm is not None:
+        return norm
+    # Unmapped 2-letter codes are passed through as-is
+    return c if len(c) == 2 and c.isalpha() else None
 
 
 def filter_allowed_candidates(
     candidates: list[dict],
-    allowed_langs: list[str],
+    allowed_langs: Iterable[str],
 ) -> list[dict]:
     """
     Return only candidates whose normalized language is in the allowed list.
 
     Args:
         candidates: A list of dicts, each expected to have a 'lang_norm' key.
-        allowed_langs: List of allowed normalized language codes.
+        allowed_langs: Allowed normalized language codes (list or set).
 
     Returns:
         A filtered list of candidates with lang_norm in allowed_langs.
     """
+    allowed = allowed_langs if isinstance(allowed_langs, (set, frozenset)) else frozenset(allowed_langs)
     return [
         c for c in candidates
-        if c.get("lang_norm") is not None and c["lang_norm"] in allowed_langs
+        if c.get("lang_norm") is not None and c["lang_norm"] in allowed
     ]
 
 
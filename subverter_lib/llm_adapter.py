@@ -169,26 +169,18 @@ class LLMAdapter:
 
         try:
             if keep_alive:
-                # Persistent mode: reuse browser session, start new topic each time (except first)
-                first_block = False
+                # Persistent mode: reuse browser session; run_prompt() starts a new
+                # topic for every prompt after the first
                 if not hasattr(self, "_copilot_client") or self._copilot_client is None:
                     try:
-                        self._copilot_client = CopilotClient(headless=False)
+                        self._copilot_client = CopilotClient(headless=False, require_session=True)
                         self._copilot_client.launch(verbosity=verbosity)
-                        first_block = True
                     except Exception as e:
                         print(f"❌ Failed to launch persistent CopilotClient: {e}")
                         return None
 
-                if not first_block:
-                    try:
-                        self._copilot_client.start_new_topic(verbosity=verbosity)
-                    except Exception as e:
-                        print(f"❌ Failed to start new topic: {e}")
-                        return None
-
                 try:
-                    resp = self._copilot_client.send_prompt(
+                    resp = self._copilot_client.run_prompt(
                         prompt_text=prompt,
                         timeout_sec=self.config.timeout_sec,
                         verbosity=verbosity
@@ -12,18 +12,140 @@ Provides:
 - High-level selection strategy with auto-selection when possible.
 """
 
-import json
+import sqlite3
 import subprocess
 import os
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from contextlib import closing
 from pathlib import Path
 from typing import Any
 
+from subverter_lib.config_manager import _json_loads
 from subverter_lib.lang_utils import normalize_lang_code, filter_allowed_candidates
 from subverter_lib.srt_utils import detect_language_from_srt
 from subprocess import CalledProcessError
 from json import JSONDecodeError
 
 
+# Extracted SRTs smaller than this are re-checked with langdetect even when the
+# track's language tag is trusted (tiny tracks are often forced/sign-only subs).
+MIN_TRUSTED_SRT_BYTES = 2048
+
+# Upper bound for a single mkvmerge -J identification run (it only reads headers)
+MKVMERGE_PROBE_TIMEOUT_SEC = 60
+
+# In-process cache of probe results keyed by
+# (mkvmerge path, mkv path, st_mtime_ns, st_size) — a changed file gets a new key.
+# Only successful probes are stored.
+_PROBE_CACHE: dict[tuple[str, str, int, int], tuple[list[dict[str, Any]], list[int]]] = {}
+
+
+# On-disk cache of raw mkvmerge -J output, shared across SubVerter invocations
+# (stored in cfg/ next to config.json)
+PROBE_CACHE_PATH = Path(__file__).parent.parent / "cfg" / "probe_cache.sqlite"
+
+# PROBE_CACHE_MAX_ROWS — on-disk cache keeps only the most recently stored entries
+PROBE_CACHE_MAX_ROWS = 1000
+
+_probe_cache_lock = threading.Lock()
+_probe_cache_pruned = False    # pruning runs once per process, on first open
+_probe_cache_disabled = False  # set after the first failure; the cache is then skipped
+
+
+def _probe_cache_disable(e: Exception) -> None:
+    """
+    Turn the on-disk probe cache off for the rest of this run, warning only once.
+    """
+    global _probe_cache_disabled
+    with _probe_cache_lock:
+        if _probe_cache_disabled:
+            return
+        _probe_cache_disabled = True
+    print(f"⚠️ Probe cache {PROBE_CACHE_PATH} unavailable, continuing without it: {e}")
+
+
+def _probe_cache_prune(conn: sqlite3.Connection) -> None:
+    """
+    Drop entries for MKVs that no longer exist, then all but the newest
+    PROBE_CACHE_MAX_ROWS (INSERT OR REPLACE gives a refreshed row a new rowid).
+    """
+    with conn:
+        gone = [(p,) for (p,) in conn.execute("SELECT path FROM probe") if not os.path.exists(p)]
+        conn.executemany("DELETE FROM probe WHERE path = ?", gone)
+        conn.execute(
+            "DELETE FROM probe WHERE rowid NOT IN "
+            "(SELECT rowid FROM probe ORDER BY rowid DESC LIMIT ?)",
+            (PROBE_CACHE_MAX_ROWS,),
+        )
+
+
+def _probe_cache_connect() -> sqlite3.Connection:
+    global _probe_cache_pruned
+    conn = sqlite3.connect(PROBE_CACHE_PATH, timeout=5)
+    try:
+        conn.execute("PRAGMA journal_mode=WAL")  # concurrent readers during batch prefetch
+        conn.execute(
+            "CREATE TABLE IF NOT EXISTS probe("
+            "path TEXT PRIMARY KEY, mtime_ns INTEGER, size INTEGER, json BLOB)"
+        )
+        with _probe_cache_lock:
+            if not _probe_cache_pruned:
+                _probe_cache_prune(conn)
+                _probe_cache_pruned = True
+    except BaseException:
+        conn.close()
+        raise
+    return conn
+
+
+def _probe_cache_get(mkv_path: Path, st: os.stat_result) -> bytes | None:
+    """
+    Return cached mkvmerge -J output for mkv_path if its mtime and size still match.
+    """
+    if _probe_cache_disabled:
+        return None
+    try:
+        with closing(_probe_cache_connect()) as conn:
+            row = conn.execute(
+                "SELECT json FROM probe WHERE path = ? AND mtime_ns = ? AND size = ?",
+                (str(mkv_path.resolve()), st.st_mtime_ns, st.st_size),
+            ).fetchone()
+    except (sqlite3.Error, OSError) as e:
+        _probe_cache_disable(e)
+        return None
+    return row[0] if row else None
+
+
+def _probe_cache_put(mkv_path: Path, st: os.stat_result, raw_json: bytes) -> None:
+    """
+    Store mkvmerge -J output for mkv_path. Failures are non-fatal (cache only).
+    """
+    if _probe_cache_disabled:
+        return
+    try:
+        with closing(_probe_cache_connect()) as conn, conn:
+            conn.execute(
+                "INSERT OR REPLACE INTO probe(path, mtime_ns, size, json) VALUES (?, ?, ?, ?)",
+                (str(mkv_path.resolve()), st.st_mtime_ns, st.st_size, raw_json),
+            )
+    except (sqlite3.Error, OSError) as e:
+        _probe_cache_disable(e)
+
+
+def _probe_cache_delete(mkv_path: Path) -> None:
+    """
+    Remove the cached entry for mkv_path (e.g. a row that no longer parses).
+    """
+    if _probe_cache_disabled:
+        return
+    try:
+        with closing(_probe_cache_connect()) as conn, conn:
+            conn.execute("DELETE FROM probe WHERE path = ?", (str(mkv_path.resolve()),))
+    except (sqlite3.Error, OSError) as e:
+        _probe_cache_disable(e)
+
+
 # probe_mkv_subtitles() — returns tagged tracks and IDs of untagged tracks
 def probe_mkv_subtitles(
     mkvmerge_path: Path,
@@ -31,51 +153,84 @@ def probe_mkv_subtitles(
 ) -> tuple[list[dict[str, Any]], list[int]]:
     """
     Use mkvmerge -J to read all tracks and split into:
-    - tagged_subs: list of dicts {id, lang_raw, lang_norm, name, codec}
+    - tagged_subs: list of dicts {id, lang_raw, lang_norm, lang_ietf, name, codec}
+      (lang_ietf is True when the tag came from the language_ietf property)
     - untagged_ids: list of subtitle track IDs with no usable language tag
+
+    Results are memoised per file identity (path, mtime, size), so repeat
+    probes of an unchanged MKV skip the mkvmerge subprocess — in memory for
+    this process, and on disk (PROBE_CACHE_PATH) across invocations.
     """
     # Fail fast: validate inputs before spawning subprocess (INC-042)
     if not mkvmerge_path.exists():
         print(f"❌ mkvmerge executable not found: {mkvmerge_path}")
         return [], []
-    if not mkv_path.exists():
+    try:
+        st = mkv_path.stat()
+    except OSError:
         print(f"❌ MKV file not found: {mkv_path}")
         return [], []
 
-    try:
-        # First attempt: keep stderr separate so JSON stays clean
-        result_json = subprocess.run(
-            [str(mkvmerge_path), "-J", str(mkv_path)],
-            capture_output=True,
-            text=True,
-            check=True
-        )
+    cache_key = (str(mkvmerge_path), str(mkv_path), st.st_mtime_ns, st.st_size)
+    cached = _PROBE_CACHE.get(cache_key)
+    if cached is not None:
+        # Hand out copies so callers can't mutate the cached entry
+        return [dict(t) for t in cached[0]], list(cached[1])
+
+    info: dict[str, Any] | None = None
+    raw_json = _probe_cache_get(mkv_path, st)
+    if raw_json is not None:
         try:
-            info = json.loads(result_json.stdout)
+            info = _json_loads(raw_json)
         except JSONDecodeError:
-            # Retry with merged stderr for diagnostics
-            print("❌ mkvmerge output was not valid JSON. Retrying with merged stderr for diagnostics...")
-            debug_run = subprocess.run(
+            # Corrupt cache row: drop it and probe the file afresh
+            _probe_cache_delete(mkv_path)
+    from_disk_cache = info is not None
+
+    try:
+        if info is None:
+            # First attempt: keep stderr separate so JSON stays clean.
+            # stdout stays raw bytes — the JSON parser decodes UTF-8 itself.
+            result_json = subprocess.run(
                 [str(mkvmerge_path), "-J", str(mkv_path)],
                 capture_output=True,
-                text=True,
-                check=False,
-                stderr=subprocess.STDOUT
+                check=True,
+                timeout=MKVMERGE_PROBE_TIMEOUT_SEC
             )
-            print("---- mkvmerge combined output ----")
-            print(debug_run.stdout)
-            print("---- end output ----")
-            return [], []
+            raw_json = result_json.stdout
+            try:
+                info = _json_loads(raw_json)
+            except JSONDecodeError:
+                # Retry with merged stderr for diagnostics
+                print("❌ mkvmerge output was not valid JSON. Retrying with merged stderr for diagnostics...")
+                debug_run = subprocess.run(
+                    [str(mkvmerge_path), "-J", str(mkv_path)],
+                    stdout=subprocess.PIPE,
+                    stderr=subprocess.STDOUT,
+                    text=True,
+                    check=False,
+                    timeout=MKVMERGE_PROBE_TIMEOUT_SEC
+                )
+                print("---- mkvmerge combined output ----")
+                print(debug_run.stdout)
+                print("---- end output ----")
+                return [], []
     except FileNotFoundError:
         print(f"❌ mkvmerge executable not found: {mkvmerge_path}")
         return [], []
     except CalledProcessError as e:
         print(f"❌ mkvmerge failed with exit code {e.returncode}: {e}")
         return [], []
+    except subprocess.TimeoutExpired:
+        print(f"❌ mkvmerge timed out after {MKVMERGE_PROBE_TIMEOUT_SEC}s probing {mkv_path}")
+        return [], []
     except JSONDecodeError as e:
         print(f"❌ Failed to parse mkvmerge JSON output: {e}")
         return [], []
 
+    if not from_disk_cache:
+        _probe_cache_put(mkv_path, st, raw_json)
+
     tagged_subs: list[dict[str, Any]] = []
     untagged_ids: list[int] = []
 
@@ -95,6 +250,7 @@ def probe_mkv_subtitles(
                     "id": tid,
                     "lang_raw": lang_raw.lower(),
                     "lang_norm": norm,
+                    "lang_ietf": bool(props.get("language_ietf")),
                     "name": name,
                     "codec": codec
                 })
@@ -103,65 +259,103 @@ def probe_mkv_subtitles(
         # No usable tag
         untagged_ids.append(tid)
 
+    _PROBE_CACHE[cache_key] = ([dict(t) for t in tagged_subs], list(untagged_ids))
     return tagged_subs, untagged_ids
 
 
-def extract_track_to_srt(
+def extract_tracks_to_srt(
     mkvextract_path: Path,
     mkv_path: Path,
-    tid: int,
-    out_path: Path
+    targets: list[tuple[int, Path]]
 ) -> bool:
     """
-    Extract a single track to SRT.
+    Extract several tracks to SRT in a single mkvextract invocation.
+
+    mkvextract reads the container once and demuxes every requested track in
+    that pass, so N tracks cost one read of the MKV instead of N.
 
     Args:
         mkvextract_path: Path to mkvextract executable.
         mkv_path: Path to MKV file.
-        tid: Track ID to extract.
-        out_path: Destination SRT file path.
+        targets: (track ID, destination SRT path) pairs.
 
     Returns:
-        True if extraction succeeded, False otherwise.
+        True if extraction succeeded for all tracks, False otherwise.
     """
-    # Fail fast: validate inputs and destination
+    # Fail fast: validate inputs and destinations
     if not mkvextract_path.exists():
         print(f"❌ mkvextract executable not found: {mkvextract_path}")
         return False
     if not mkv_path.exists():
         print(f"❌ MKV file not found: {mkv_path}")
         return False
+    if not targets:
+        return True
 
-    out_dir = out_path.parent
-    if not out_dir.exists():
-        try:
-            out_dir.mkdir(parents=True, exist_ok=True)
-        except OSError as e:
-            print(f"❌ Cannot create output directory {out_dir}: {e}")
+    for out_dir in {out_path.parent for _, out_path in targets}:
+        if not out_dir.exists():
+            try:
+                out_dir.mkdir(parents=True, exist_ok=True)
+            except OSError as e:
+                print(f"❌ Cannot create output directory {out_dir}: {e}")
+                return False
+        if not os.access(out_dir, os.W_OK):
+            print(f"❌ Cannot write to output directory: {out_dir}")
             return False
-    if not os.access(out_dir, os.W_OK):
-        print(f"❌ Cannot write to output directory: {out_dir}")
-        return False
 
+    tids = ", ".join(str(tid) for tid, _ in targets)
     try:
+        # Tracks are written to disk. MKVToolNix reports Error:/Warning: lines on
+        # stdout, so merge stderr into it and keep the bytes for the error message.
         subprocess.run(
-            [str(mkvextract_path), "tracks", str(mkv_path), f"{tid}:{out_path}"],
+            [
+                str(mkvextract_path), "tracks", str(mkv_path),
+                *(f"{tid}:{out_path}" for tid, out_path in targets),
+            ],
             check=True,
-            text=True
+            stdout=subprocess.PIPE,
+            stderr=subprocess.STDOUT
         )
         return True
     except subprocess.CalledProcessError as e:
-        print(f"❌ Failed to extract track {tid}: {e}")
+        print(f"❌ Failed to extract track(s) {tids}: {e}")
+        output = (e.output or b"").decode("utf-8", errors="replace").strip()
+        if output:
+            print("   ↳ mkvextract output:")
+            for line in output.splitlines():
+                print(f"     {line}")
         return False
     except OSError as e:
-        print(f"❌ File system error during extraction for track {tid}: {e}")
+        print(f"❌ File system error during extraction for track(s) {tids}: {e}")
         return False
 
 
+def extract_track_to_srt(
+    mkvextract_path: Path,
+    mkv_path: Path,
+    tid: int,
+    out_path: Path
+) -> bool:
+    """
+    Extract a single track to SRT (thin wrapper over extract_tracks_to_srt).
+
+    Args:
+        mkvextract_path: Path to mkvextract executable.
+        mkv_path: Path to MKV file.
+        tid: Track ID to extract.
+        out_path: Destination SRT file path.
+
+    Returns:
+        True if extraction succeeded, False otherwise.
+    """
+    return extract_tracks_to_srt(mkvextract_path, mkv_path, [(tid, out_path)])
+
+
 def extract_and_validate_track(
     mkvextract_path: Path,
     mkv_path: Path,
-    tid: int
+    tid: int,
+    trusted_lang: str | None = None
 ) -> tuple[str | None, Path | None]:
     """
     Extract a subtitle track to SRT and detect its language.
@@ -170,6 +364,9 @@ def extract_and_validate_track(
         mkvextract_path: Path to mkvextract executable.
         mkv_path: Path to MKV file.
         tid: Track ID to extract.
+        trusted_lang: Normalized language from an authoritative track tag. When set,
+            language detection is skipped unless the extracted SRT is smaller
+            than MIN_TRUSTED_SRT_BYTES.
 
     Returns:
         (lang_norm, out_srt_path) if successful, else (None, None).
@@ -178,18 +375,48 @@ def extract_and_validate_track(
     if not extract_track_to_srt(mkvextract_path, mkv_path, tid, out_srt):
         return None, None
 
+    norm = validate_extracted_track(tid, out_srt, trusted_lang)
+    return (norm, out_srt) if norm else (None, None)
+
+
+def validate_extracted_track(
+    tid: int,
+    out_srt: Path,
+    trusted_lang: str | None = None
+) -> str | None:
+    """
+    Determine the language of an already-extracted subtitle track.
+
+    Args:
+        tid: Track ID (for messages).
+        out_srt: Path to the extracted SRT file.
+        trusted_lang: Normalized language from an authoritative track tag. When set,
+            language detection is skipped unless the SRT is smaller than
+            MIN_TRUSTED_SRT_BYTES.
+
+    Returns:
+        Normalized language code, or None if detection failed.
+    """
+    if trusted_lang:
+        try:
+            trusted = out_srt.stat().st_size >= MIN_TRUSTED_SRT_BYTES
+        except OSError:
+            trusted = False
+        if trusted:
+            print(f"   ✅ Extracted track {tid} (trusted tag: {trusted_lang})")
+            return trusted_lang
+
     try:
         lang = detect_language_from_srt(out_srt)
     except Exception as e:
         print(f"❌ Failed to detect language from {out_srt}: {e}")
-        return None, None
+        return None
 
     if not lang:
-        return None, None
+        return None
 
-    norm = normalize_lang_code(lang)
     print(f"   ✅ Extracted and validated track {tid} (detected: {lang})")
-    return norm, out_srt
+    return normalize_lang_code(lang)
 
 
 def choose_mkv_subtitle_interactive(
@@ -199,12 +426,16 @@ def choose_mkv_subtitle_interactive(
     tagged_subs: list[dict[str, Any]],
     untagged_ids: list[int],
     allowed_src_langs_ordered: list[str],
+    trust_language_tag: bool = True,
 ) -> tuple[str | None, int | None, Path | None, list[Path]]:
     """
     Build a candidate list and let the user choose.
 
     - For untagged tracks: extract and detect language up front.
-    - For tagged tracks: show tag only; extract/validate only if chosen.
+    - For tagged tracks: show tag only; validate only if chosen (validation is
+      skipped for trusted language_ietf tags, see validate_extracted_track).
+      Allowed tagged tracks ride along in the untagged mkvextract pass, so the
+      chosen one is not extracted a second time.
     - Filters to allowed languages (already excludes target language).
 
     Returns:
@@ -224,15 +455,47 @@ def choose_mkv_subtitle_interactive(
     cleanup_paths: list[Path] = []
     candidates: list[dict[str, Any]] = []
 
-    # Detect untagged languages by extracting them
-    if untagged_ids:
+    # Detect untagged languages by extracting them (all in one mkvextract pass).
+    # mkvextract reads the whole file once regardless of track count, so the
+    # allowed tagged tracks are extracted in the same pass for later selection.
+    temp_srts = {
+        tid: mkv_path.with_name(f"{mkv_path.stem}_track{tid}.srt") for tid in untagged_ids
+    }
+    tagged_srts = {
+        t["id"]: mkv_path.with_name(f"{mkv_path.stem}_track{t['id']}.srt")
+        for t in filter_allowed_candidates(tagged_subs, allowed_src_langs_ordered)
+    } if temp_srts else {}
+    extracted: dict[int, bool] = {}
+    if temp_srts:
         print("🔎 Detecting languages for untagged subtitle tracks...")
-    for tid in untagged_ids:
-        temp_srt = mkv_path.with_name(f"{mkv_path.stem}_track{tid}.srt")
-        if extract_track_to_srt(mkvextract_path, mkv_path, tid, temp_srt):
-            cleanup_paths.append(temp_srt)
+        batch = list(temp_srts.items()) + list(tagged_srts.items())
+        # Register every output up front: a failed run can still leave partial files behind
+        cleanup_paths.extend(srt for _, srt in batch)
+        if extract_tracks_to_srt(mkvextract_path, mkv_path, batch):
+            extracted = dict.fromkeys(temp_srts.keys() | tagged_srts.keys(), True)
+        elif len(temp_srts) > 1 or tagged_srts:
+            # Retry one track at a time so a single bad track doesn't sink the rest
+            print("   ⚠️ Batch extraction failed — retrying tracks individually...")
+            extracted = {
+                tid: extract_track_to_srt(mkvextract_path, mkv_path, tid, temp_srt)
+                for tid, temp_srt in temp_srts.items()
+            }
+
+    # Detect all extracted tracks concurrently (file reads overlap across tracks);
+    # results are consumed below in track order so output stays deterministic.
+    detections: dict[int, Future] = {}
+    extracted_srts = [(tid, temp_srt) for tid, temp_srt in temp_srts.items() if extracted.get(tid)]
+    if extracted_srts:
+        with ThreadPoolExecutor(max_workers=min(8, len(extracted_srts))) as pool:
+            detections = {
+                tid: pool.submit(detect_language_from_srt, temp_srt)
+                for tid, temp_srt in extracted_srts
+            }
+
+    for tid, temp_srt in temp_srts.items():
+        if extracted.get(tid):
             try:
-                lang = detect_language_from_srt(temp_srt)
+                lang = detections[tid].result()
             except Exception as e:
                 print(f"❌ Failed to detect language from {temp_srt}: {e}")
                 lang = None
@@ -254,16 +517,17 @@ def choose_mkv_subtitle_interactive(
         else:
             print(f"   ⚠️ Skipping untagged track {tid}: extraction failed")
 
-    # Add tagged tracks (not yet extracted)
+    # Add tagged tracks (extracted above only if they were part of a successful batch)
     for t in tagged_subs:
         candidates.append({
             "id": t["id"],
             "lang_norm": t["lang_norm"],
             "lang_raw": t["lang_raw"],
+            "lang_ietf": t.get("lang_ietf", False),
             "source": "tagged",
             "name": t.get("name"),
             "codec": t.get("codec"),
-            "srt_path": None
+            "srt_path": tagged_srts[t["id"]] if extracted.get(t["id"]) else None
         })
 
     # Filter to allowed languages
@@ -298,10 +562,22 @@ def choose_mkv_subtitle_interactive(
             break
         print("   ⚠️ Choice out of range.")
 
-    # If tagged, extract now and validate
+    # If tagged, validate now (extracting first unless the batch pass already did)
     if selected["source"] == "tagged":
+        trusted_lang = (
+            selected["lang_norm"]
+            if trust_language_tag and selected["lang_ietf"] else None
+        )
+        if selected["srt_path"] is not None:
+            out_srt = selected["srt_path"]
+            norm = validate_extracted_track(selected["id"], out_srt, trusted_lang)
+            if not norm:
+                print(f"   ❌ Validation failed for track {selected['id']}")
+                return None, None, None, cleanup_paths
+            return norm, selected["id"], out_srt, cleanup_paths
+
         norm, out_srt = extract_and_validate_track(
-            mkvextract_path, mkv_path, selected["id"]
+            mkvextract_path, mkv_path, selected["id"], trusted_lang=trusted_lang
         )
         if norm and out_srt:
             cleanup_paths.append(out_srt)
@@ -320,6 +596,8 @@ def select_mkv_subtitle(
     mkvmerge_path: Path,
     mkvextract_path: Path,
     allowed_src_langs_ordered: list[str],
+    trust_language_tag: bool = True,
+    probe: tuple[list[dict[str, Any]], list[int]] | None = None,
 ) -> tuple[str | None, int | None, Path | None, list[Path]]:
     """
     High-level selection strategy for choosing a subtitle track from an MKV.
@@ -336,22 +614,34 @@ def select_mkv_subtitle(
         mkvmerge_path: Path to mkvmerge executable.
         mkvextract_path: Path to mkvextract executable.
         allowed_src_langs_ordered: List of allowed source languages in priority order.
+        trust_language_tag: If True, a chosen track's language_ietf tag is taken as
+            authoritative and post-extraction language detection is skipped.
+        probe: Result of an earlier probe_mkv_subtitles() call for this file
+            (e.g. from the batch prefetch); if given, mkvmerge is not run again.
 
     Returns:
         (src_lang_norm, track_id, srt_path, cleanup_paths)
     """
     cleanup_paths: list[Path] = []
 
-    try:
-        tagged, untagged_ids = probe_mkv_subtitles(mkvmerge_path, mkv_path)
-    except Exception as e:
-        print(f"❌ Failed to probe MKV subtitles: {e}")
-        return None, None, None, []
+    if probe is not None:
+        tagged, untagged_ids = probe
+    else:
+        try:
+            tagged, untagged_ids = probe_mkv_subtitles(mkvmerge_path, mkv_path)
+        except Exception as e:
+            print(f"❌ Failed to probe MKV subtitles: {e}")
+            return None, None, None, []
 
     # --- Fast-path: all tagged, no untagged ---
     if tagged and not untagged_ids:
+        # Group tracks by language once, then walk priorities with O(1) lookups
+        by_lang: dict[str, list[dict[str, Any]]] = {}
+        for t in tagged:
+            by_lang.setdefault(t["lang_norm"], []).append(t)
+
         for pref_lang in allowed_src_langs_ordered:
-            matches = filter_allowed_candidates(tagged, [pref_lang])
+            matches = by_lang.get(pref_lang)
             if not matches:
                 continue
 
@@ -362,7 +652,11 @@ def select_mkv_subtitle(
                     f"({choice['lang_norm']}) based on priority."
                 )
                 norm, out_srt = extract_and_validate_track(
-                    mkvextract_path, mkv_path, choice["id"]
+                    mkvextract_path, mkv_path, choice["id"],
+                    trusted_lang=(
+                        choice["lang_norm"]
+                        if trust_language_tag and choice["lang_ietf"] else None
+                    ),
                 )
                 if norm and out_srt:
                     cleanup_paths.append(out_srt)
@@ -382,6 +676,7 @@ def select_mkv_subtitle(
                 tagged_subs=matches,      # restrict to ambiguous set
                 untagged_ids=[],          # none, all tagged here
                 allowed_src_langs_ordered=allowed_src_langs_ordered,
+                trust_language_tag=trust_language_tag,
             )
             cleanup_paths.extend(extra_cleanup)
             return lang_norm, track_id, srt_path, cleanup_paths
@@ -398,6 +693,7 @@ def select_mkv_subtitle(
         tagged_subs=tagged,
         untagged_ids=untagged_ids,
         allowed_src_langs_ordered=allowed_src_langs_ordered,
+        trust_language_tag=trust_language_tag,
     )
     cleanup_paths.extend(extra_cleanup)
     return lang_norm, track_id, srt_path, cleanup_paths
\ No newline at end of file
@@ -12,20 +12,133 @@ Handles:
 - Validation, reformatting, and output of final SRT.
 """
 
+import io
 import os
+import sys
+import threading
 
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
 from pathlib import Path
-from typing import Sequence
+from typing import Any, Callable, Sequence
 
 from subverter_lib.config_manager import load_config
 from subverter_lib.lang_utils import normalize_lang_code
 from subverter_lib.srt_utils import detect_language_from_srt, parse_srt
-from subverter_lib.mkv_utils import select_mkv_subtitle
+from subverter_lib.mkv_utils import probe_mkv_subtitles, select_mkv_subtitle
 from subverter_lib.llm_adapter import LLMAdapter, LLMConfig
 from subverter_lib.translator import translate_entries_with_context
 from subverter_lib.reformat import reformat_subtitle_text
 
 
+def find_existing_files(files: Sequence[Path]) -> set[Path]:
+    """
+    Return the subset of files that exist, using one os.scandir() per parent
+    directory (instead of one stat() per file) for directories holding several inputs.
+
+    Names not found in the listing (e.g. different letter case on Windows) are
+    re-checked with Path.exists(), so the result matches per-file checks.
+    """
+    by_parent: dict[Path, list[Path]] = {}
+    for f in files:
+        by_parent.setdefault(f.parent, []).append(f)
+
+    existing: set[Path] = set()
+    for parent, group in by_parent.items():
+        names: set[str] = set()
+        if len(group) > 1:
+            try:
+                with os.scandir(parent) as it:
+                    names = {entry.name for entry in it}
+            except OSError:
+                pass
+        existing.update(f for f in group if f.name in names or f.exists())
+    return existing
+
+
+@dataclass
+class PrefetchResult:
+    """
+    Outcome of one prefetch job, reported later inside the per-file loop.
+    """
+    value: Any = None
+    error: Exception | None = None
+    output: str = ""  # console output the job produced, replayed under the file's header
+
+
+class _ThreadRoutedStdout(io.TextIOBase):
+    """
+    sys.stdout stand-in used while prefetch workers run: writes from a capturing
+    worker thread go to that thread's buffer, everything else to the real stream.
+    """
+    def __init__(self, target):
+        self._target = target
+        self._local = threading.local()
+
+    def write(self, s: str) -> int:
+        buf = getattr(self._local, "buf", None)
+        return (buf if buf is not None else self._target).write(s)
+
+    def flush(self) -> None:
+        self._target.flush()
+
+    def run_captured(self, fn: Callable[..., Any], *args: Any) -> PrefetchResult:
+        """Run fn(*args) in the current thread, capturing its output and any exception."""
+        buf = self._local.buf = io.StringIO()
+        try:
+            value, error = fn(*args), None
+        except Exception as e:
+            value, error = None, e
+        finally:
+            self._local.buf = None
+        return PrefetchResult(value, error, buf.getvalue())
+
+
+def prefetch_sources(
+    files: Sequence[Path],
+    mkvmerge_path: Path | None,
+) -> dict[Path, PrefetchResult]:
+    """
+    Inspect all input files concurrently before the (serial) translation loop.
+
+    The work here is subprocess/I/O bound (mkvmerge -J, SRT reads), so a thread
+    pool overlaps it across files:
+    - .srt → language detected up front (value: language code or None).
+    - .mkv → probe_mkv_subtitles() run up front (value: (tagged, untagged_ids)),
+             handed to select_mkv_subtitle() so mkvmerge is not spawned again —
+             even when the probe failed.
+
+    Workers do not print: each job's console output and exception are kept in
+    its PrefetchResult so run_pipeline() can report them under the file's header.
+    Interactive track selection and translation stay serial in run_pipeline().
+
+    Args:
+        files: Existing input files (unsupported types are ignored).
+        mkvmerge_path: Path to mkvmerge executable, or None to skip MKV probing.
+
+    Returns:
+        Mapping of input path → PrefetchResult (empty if there was nothing to overlap).
+    """
+    srt_files = [f for f in files if f.suffix.lower() == ".srt"]
+    mkv_files = [f for f in files if f.suffix.lower() == ".mkv"] if mkvmerge_path else []
+    if len(srt_files) + len(mkv_files) < 2:
+        return {}  # nothing to overlap
+
+    max_workers = min(len(srt_files) + len(mkv_files), os.cpu_count() or 4)
+    routed = _ThreadRoutedStdout(sys.stdout)
+    sys.stdout = routed
+    try:
+        with ThreadPoolExecutor(max_workers=max_workers) as pool:
+            jobs = {f: pool.submit(routed.run_captured, detect_language_from_srt, f) for f in srt_files}
+            jobs.update(
+                (f, pool.submit(routed.run_captured, probe_mkv_subtitles, mkvmerge_path, f))
+                for f in mkv_files
+            )
+    finally:
+        sys.stdout = routed._target
+    return {f: job.result() for f, job in jobs.items()}
+
+
 def run_pipeline(files: Sequence[Path], verbosity: int = 0) -> None:
     """
     Main processing pipeline for SubVerter.
@@ -60,19 +173,35 @@ def run_pipeline(files: Sequence[Path], verbosity: int = 0) -> None:
         print(f"   🎯 Target language          : {tgt_lang}")
         print("   ⚠️  Please update your configuration to include at least one valid source language.\n")
         return
+    # Set view for O(1) membership tests; the list keeps the priority order
+    allowed_src_langs = frozenset(allowed_src_langs_ordered)
 
     mkvextract_path = Path(cfg["mkvextract_path"])
     mkvmerge_path = Path(cfg["mkvmerge_path"])
 
+    # Filesystem checks done once for the whole batch, not per file
+    mkvtoolnix_found = mkvmerge_path.exists() and mkvextract_path.exists()
+    existing_files = find_existing_files(files)
+
+    # Overlap per-file language detection / MKV probing across the whole batch
+    prefetched = prefetch_sources(
+        [f for f in files if f in existing_files],
+        mkvmerge_path if mkvtoolnix_found else None,
+    )
+
     for f in files:
         print("\n" + "=" * 60)
         print(f"📂 Processing file: {f.name}")
         print("=" * 60 + "\n")
 
-        if not f.exists():
+        if f not in existing_files:
             print(f"⚠️ Skipping missing file: {f}\n")
             continue
 
+        ext = f.suffix.lower()
+        pre = prefetched.get(f)
+        if pre is not None:
+            print(pre.output, end="")
         llm: LLMAdapter | None = None
         src_lang: str | None = None
         working_srt: Path | None = None
@@ -80,23 +209,29 @@ def run_pipeline(files: Sequence[Path], verbosity: int = 0) -> None:
 
         try:
             # --- SRT handling ---
-            if f.suffix.lower() == ".srt":
-                lang = detect_language_from_srt(f)
+            if ext == ".srt":
+                if pre is None:
+                    lang = detect_language_from_srt(f)
+                elif pre.error is not None:
+                    print(f"❌ Language detection failed for {f.name}: {pre.error}")
+                    continue
+                else:
+                    lang = pre.value
                 if not lang:
                     print(f"❌ Could not detect language for {f.name}.")
                     continue
                 src_lang = normalize_lang_code(lang)
                 print(f"🌐 Detected source language: {src_lang}")
 
-                if src_lang not in allowed_src_langs_ordered:
+                if src_lang not in allowed_src_langs:
                     print(f"❌ Source language '{src_lang}' is not in allowed list.")
                     continue
 
                 working_srt = f
 
             # --- MKV handling ---
-            elif f.suffix.lower() == ".mkv":
-                if not mkvmerge_path.exists() or not mkvextract_path.exists():
+            elif ext == ".mkv":
+                if not mkvtoolnix_found:
                     print(
                         f"❌ mkvtoolnix not found (expected mkvmerge at {mkvmerge_path}, "
                         f"mkvextract at {mkvextract_path})"
@@ -104,12 +239,18 @@ def run_pipeline(files: Sequence[Path], verbosity: int = 0) -> None:
                     print("   Update mkvextract_path in config or install MKVToolNix.\n")
                     continue
 
+                if pre is not None and pre.error is not None:
+                    print(f"❌ Failed to probe MKV subtitles: {pre.error}")
+                    continue
+
                 try:
                     src_lang, track_id, srt_path, cleanup_paths = select_mkv_subtitle(
                         mkv_path=f,
                         mkvmerge_path=mkvmerge_path,
                         mkvextract_path=mkvextract_path,
-                        allowed_src_langs_ordered=allowed_src_langs_ordered
+                        allowed_src_langs_ordered=allowed_src_langs_ordered,
+                        trust_language_tag=bool(cfg.get("trust_mkv_language_tag", True)),
+                        probe=pre.value if pre is not None else None,
                     )
                 except Exception as e:
                     print(f"❌ Failed to select MKV subtitle: {e}")
@@ -202,7 +343,7 @@ def run_pipeline(files: Sequence[Path], verbosity: int = 0) -> None:
             print("💾 Step 4: Write final SRT next to input file")
 
             # Decide base name:
-            if f.suffix.lower() == ".srt":
+            if ext == ".srt":
                 # If filename ends with ".<src_lang>.srt", strip the src_lang part
                 src_suffix = f".{src_lang.lower()}"
                 if f.stem.lower().endswith(src_suffix):
@@ -245,7 +386,7 @@ def run_pipeline(files: Sequence[Path], verbosity: int = 0) -> None:
 
                 # ✅ Remove extracted MKV track SRT if translation succeeded
                 try:
-                    if f.suffix.lower() == ".mkv" and working_srt != f and working_srt.exists():
+                    if ext == ".mkv" and working_srt != f and working_srt.exists():
                         working_srt.unlink()
                         if verbosity >= 1:
                             print(f"🗑️ Deleted temporary source-language SRT: {working_srt}")
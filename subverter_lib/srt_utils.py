@@ -11,16 +11,60 @@ Provides:
 - Utility functions for building translation blocks and extracting context.
 """
 
+import mmap
+import os
 import re
+import threading
 from dataclasses import dataclass
 from pathlib import Path
 from typing import List, Tuple
 
+# Language detectors, fastest first. All are optional at import time; a missing
+# dependency is reported when detection is first attempted.
+# - cld3 (pycld3): compiled C++ classifier (optional extra, see README).
+# - fasttext: optional extra, used only if the lid.176 model has been placed in cfg/.
+# - langdetect: pure-Python fallback (listed in requirements.txt).
+try:
+    import cld3 as _cld3
+except ImportError:
+    _cld3 = None
+
+try:
+    import fasttext as _fasttext
+except ImportError:
+    _fasttext = None
+
+try:
+    from langdetect import DetectorFactory as _DetectorFactory, detect as _detect
+    from langdetect.detector_factory import init_factory as _init_factory
+    _DetectorFactory.seed = 0  # deterministic results across runs
+except ImportError:
+    _detect = None
+_langdetect_ready = False  # profiles loaded on the first langdetect fallback
+_langdetect_lock = threading.Lock()  # langdetect's own lazy init is not thread-safe
+
+# Path to the optional fastText language-ID model (download lid.176.bin or lid.176.ftz)
+FASTTEXT_MODEL_PATH = Path(__file__).parent.parent / "cfg" / "lid.176.bin"
+_fasttext_model = None  # loaded once on first use, then shared for the whole batch
+_fasttext_lock = threading.Lock()  # detection runs from worker threads; load the model only once
+
 # SRT_TIME_RE — matches "HH:MM:SS,mmm --> HH:MM:SS,mmm" timestamp lines
 SRT_TIME_RE = re.compile(
     r"^\s*(\d{2}:\d{2}:\d{2},\d{3})\s*-->\s*(\d{2}:\d{2}:\d{2},\d{3})\s*$"
 )
 
+# SRT_TAG_RE — matches inline <html> and {ass} style tags in a single pass
+SRT_TAG_RE = re.compile(r"<[^>]+>|\{[^}]+\}")
+
+# SRT_DIALOGUE_RE — matches (as bytes) every non-blank line that is neither an index
+# nor a timestamp; group 1 is the line without surrounding whitespace / BOM.
+# Line boundaries are CR or LF, so \n, \r\n and bare-\r (classic Mac) files all work.
+SRT_DIALOGUE_RE = re.compile(
+    rb"(?:^|(?<=[\r\n]))(?:\xef\xbb\xbf|(?!\xef\xbb\xbf))"
+    rb"(?![ \t]*\d+[ \t]*(?:[\r\n]|\Z))(?![^\r\n]*-->)"
+    rb"[ \t]*(\S[^\r\n]*?)[ \t]*(?=[\r\n]|\Z)"
+)
+
 
 @dataclass
 class SRTEntry:
@@ -33,6 +77,60 @@ class SRTEntry:
     text: str  # single string with internal newlines preserved
 
 
+def _get_fasttext_model():
+    """
+    Return the fastText language-ID model, loading it on first use.
+    Returns None if fasttext is not installed or the model file is absent.
+    """
+    global _fasttext_model
+    if _fasttext_model is None and _fasttext is not None and FASTTEXT_MODEL_PATH.exists():
+        with _fasttext_lock:
+            if _fasttext_model is None:
+                _fasttext_model = _fasttext.load_model(str(FASTTEXT_MODEL_PATH))
+    return _fasttext_model
+
+
+def _init_langdetect() -> None:
+    """
+    Load langdetect's language profiles once, before the first detection.
+    """
+    global _langdetect_ready
+    if not _langdetect_ready:
+        with _langdetect_lock:
+            if not _langdetect_ready:
+                _init_factory()
+                _langdetect_ready = True
+
+
+def detect_language(sample: str) -> str | None:
+    """
+    Detect the language of a text sample using the fastest available detector.
+
+    Tries cld3, then fastText (lid.176), then langdetect.
+
+    Args:
+        sample: Plain text to classify.
+
+    Returns:
+        Detected language code (may include a script/region suffix) or None.
+    """
+    if _cld3 is not None:
+        pred = _cld3.get_language(sample)
+        if pred is not None and pred.is_reliable and pred.language != "und":
+            return pred.language
+
+    model = _get_fasttext_model()
+    if model is not None:
+        labels, _ = model.predict(sample.replace("\n", " "), k=1)
+        if labels:
+            return labels[0].removeprefix("__label__")
+
+    if _detect is not None:
+        _init_langdetect()
+        return _detect(sample)
+    return None
+
+
 def detect_language_from_srt(path: Path, verbosity: int = 0) -> str | None:
     """
     Detect the language of an SRT file's subtitle text.
@@ -44,31 +142,33 @@ def detect_language_from_srt(path: Path, verbosity: int = 0) -> str | None:
     Returns:
         Detected language code (ISO 639-1/2) or None if detection fails.
     """
-    try:
-        from langdetect import detect, DetectorFactory
-        DetectorFactory.seed = 0
-    except ImportError:
-        print("❌ Missing dependency: langdetect. Please install it first.")
+    if _cld3 is None and _detect is None and (_fasttext is None or not FASTTEXT_MODEL_PATH.exists()):
+        print(
+            "❌ Missing dependency: no language detector available. "
+            "Please install langdetect (or the optional pycld3 / fastText + cfg/lid.176.bin)."
+        )
         return None
 
     try:
         text_lines: list[str] = []
-        with open(path, encoding="utf-8", errors="ignore") as f:
-            for line in f:
-                if "-->" in line or line.strip().isdigit():
-                    continue
-                line = re.sub(r"<[^>]+>", "", line)  # strip HTML-like tags
-                line = re.sub(r"\{[^}]+\}", "", line)  # strip {tags}
-                line = line.strip()
-                if line:
-                    text_lines.append(line)
-                if len(text_lines) >= 80:
-                    break
+        # Memory-map the file so only the pages up to the 80-line cap are faulted in.
+        # The regex engine skips index, timestamp and blank lines over raw bytes;
+        # only dialogue lines are decoded.
+        with open(path, "rb") as f:
+            if os.fstat(f.fileno()).st_size > 0:  # mmap rejects empty files
+                with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                    for m in SRT_DIALOGUE_RE.finditer(mm):
+                        line = m.group(1).decode("utf-8", errors="ignore")
+                        line = SRT_TAG_RE.sub("", line).strip()  # strip <tags> and {tags}
+                        if line:
+                            text_lines.append(line)
+                            if len(text_lines) >= 80:
+                                break
         sample = " ".join(text_lines)
         if not sample.strip():
             print(f"⚠️ No text found in {path.name} for language detection.")
             return None
-        lang = detect(sample)
+        lang = detect_language(sample)
         if verbosity >= 1:
             print(f"   🛈 Language detection sample length: {len(sample)} chars")
             if verbosity >= 2:
@@ -23,6 +23,9 @@ from subverter_lib.lang_utils import normalize_text
 # Regex to detect ENTRY labels at the start of lines
 ENTRY_LABEL_RE = re.compile(r"^ENTRY\s+\d+:\s*", re.IGNORECASE)
 
+# Zero-width split point before each "ENTRY N:" label in a model response
+ENTRY_SPLIT_RE = re.compile(r"(?=ENTRY \d+:)")
+
 
 def indent_block(text: str, prefix: str = "      ") -> str:
     return "\n".join(prefix + line for line in text.splitlines())
@@ -32,7 +35,7 @@ def split_on_entry_labels(text: str) -> list[str]:
     """
     Split translated text into parts based on ENTRY labels.
     """
-    parts = re.split(r'(?=ENTRY \d+:)', text)
+    parts = ENTRY_SPLIT_RE.split(text)
     return [p.strip() for p in parts if p.strip()]
 
 